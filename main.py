@@ -1,19 +1,40 @@
-import math
+import asyncio
+import hashlib
 import threading
+import time
+import traceback
 from datetime import datetime, timezone
-from typing import List, Tuple
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
 import json
 import os
 from pathlib import Path
 import numpy as np
 
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 import requests
+from requests.adapters import HTTPAdapter
 import tkinter as tk
 from tkinter import ttk
 
-import matplotlib.pyplot as plt
+import matplotlib
+
+# The Tk canvas is embedded directly, so pyplot and its interactive backend
+# resolution are never needed.
+matplotlib.use("Agg")
+
+import matplotlib.dates as mdates
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.figure import Figure
 
 
 # =========================
@@ -25,7 +46,11 @@ USGS_URL = (
 )
 
 REQUEST_TIMEOUT_SECONDS = 10
+MIN_REFRESH_INTERVAL_SECONDS = 5
 MAX_TABLE_ROWS = 50
+PLOT_MAX_POINTS = 500
+HISTORY_RETENTION_MS = 7 * 86_400_000
+ENERGY_BINS = 30
 
 WINDOW_WIDTH = 1000
 WINDOW_HEIGHT = 600
@@ -34,100 +59,417 @@ FIGURE_SIZE = (6, 6)
 
 APP_DATA_DIR = Path(os.getenv("APPDATA", "."))
 APP_DATA_DIR.mkdir(parents=True, exist_ok=True)
-HISTORY_FILE = APP_DATA_DIR / "earthquake_history.json"
+HISTORY_FILE = APP_DATA_DIR / "earthquake_history.ndjson"
+LEGACY_HISTORY_FILE = APP_DATA_DIR / "earthquake_history.json"
+MAX_HISTORY_BYTES = 32 * 1024 * 1024
 
 
 # =========================
 # Data Access Layer
 # =========================
 
-def fetch_earthquake_features() -> List[dict]:
+def _json_loads(data: bytes):
+    """
+    Decode JSON bytes, using orjson when it is installed.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """
+    Encode an object as UTF-8 JSON bytes, using orjson when it is installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+# Shared across refreshes so repeat requests reuse the TCP/TLS connection.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
+
+def fetch_earthquake_features(
+    validators: Dict[str, str],
+) -> Tuple[Optional[List[dict]], Dict[str, str]]:
     """
     Fetch earthquake data from USGS.
+    Sends the cached ETag/Last-Modified validators and returns
+    (features, validators for the new response); the caller stores the
+    validators only once the features have been applied.
+    features is None when the feed has not changed (304 Not Modified, or a
+    body identical to the previous one).
     Raises RuntimeError on failure.
     """
+    headers = {"Accept-Encoding": "gzip"}
+    if "etag" in validators:
+        headers["If-None-Match"] = validators["etag"]
+    if "last_modified" in validators:
+        headers["If-Modified-Since"] = validators["last_modified"]
+
     try:
-        response = requests.get(USGS_URL, timeout=REQUEST_TIMEOUT_SECONDS)
+        response = _SESSION.get(
+            USGS_URL,
+            timeout=REQUEST_TIMEOUT_SECONDS,
+            headers=headers,
+        )
+        if response.status_code == 304:
+            return None, validators
         response.raise_for_status()
-        data = response.json()
-        return data.get("features", [])
-    except requests.RequestException as exc:
+
+        digest = hashlib.blake2b(response.content, digest_size=8).hexdigest()
+        if digest == validators.get("digest"):
+            return None, validators
+
+        data = _json_loads(response.content)
+    except (requests.RequestException, ValueError) as exc:
         raise RuntimeError("Failed to fetch earthquake data") from exc
 
+    new_validators = {"digest": digest}
+
+    if "ETag" in response.headers:
+        new_validators["etag"] = response.headers["ETag"]
+    if "Last-Modified" in response.headers:
+        new_validators["last_modified"] = response.headers["Last-Modified"]
+
+    return data.get("features", []), new_validators
+
 
 # =========================
 # Data Processing
 # =========================
 
-def parse_earthquakes(
-    features: List[dict],
-) -> Tuple[List[tuple], List[datetime], List[float], List[float]]:
+# 10 ** (1.5 * mag) == 2 ** (mag * 1.5 * log2(10))
+_ENERGY_EXP2_SCALE = 1.5 * np.log2(10.0)
+
+
+# Matplotlib date units (float days), computed once per event at parse time.
+_MS_TO_DAYS = 1.0 / 86_400_000
+_EPOCH_DAYS = mdates.date2num(np.datetime64("1970-01-01T00:00:00"))
+
+
+def _energy_kernel(
+    mags: np.ndarray,
+    depths: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Convert raw feature data into table rows and plotting series.
+    Single-pass validity mask and relative energy for each event.
+    Written as an explicit loop so Numba can compile it when installed.
     """
-    rows = []
-    times = []
-    magnitudes = []
-    energies = []
+    valid = np.empty(mags.size, dtype=np.bool_)
+    energies = np.empty(mags.size, dtype=np.float64)
 
-    for feature in features:
-        properties = feature.get("properties", {})
-        geometry = feature.get("geometry", {})
+    for i in range(mags.size):
+        valid[i] = np.isfinite(mags[i]) and np.isfinite(depths[i])
+        # Relative seismic energy (logarithmic, not absolute joules)
+        energies[i] = np.exp2(mags[i] * _ENERGY_EXP2_SCALE)
 
-        magnitude = properties.get("mag")
-        coordinates = geometry.get("coordinates", [])
+    return valid, energies
+
+
+def _energy_numpy(
+    mags: np.ndarray,
+    depths: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized equivalent of _energy_kernel for when Numba is unavailable.
+    """
+    valid = np.isfinite(mags) & np.isfinite(depths)
+    # Relative seismic energy (logarithmic, not absolute joules)
+    energies = np.exp2(mags * _ENERGY_EXP2_SCALE)
+    return valid, energies
 
-        if magnitude is None or len(coordinates) < 3:
-            continue
 
-        depth_km = coordinates[2]
-        timestamp_ms = properties.get("time")
-        place = properties.get("place", "Unknown location")
+if njit is not None:
+    compute_energies = njit(cache=True)(_energy_kernel)
+else:
+    compute_energies = _energy_numpy
+
+
+class QuakeSeries(NamedTuple):
+    """
+    Column-oriented (SoA) view of parsed earthquake features.
+    """
+    ids: np.ndarray
+    times: np.ndarray
+    days: np.ndarray
+    mags: np.ndarray
+    depths: np.ndarray
+    energies: np.ndarray
+    places: np.ndarray
+    time_labels: np.ndarray
+    mag_labels: np.ndarray
+    depth_labels: np.ndarray
+
+
+def parse_earthquakes(features: List[dict]) -> QuakeSeries:
+    """
+    Convert raw feature data into column arrays for the table and plots.
+    """
+    event_ids = []
+    magnitudes = []
+    depths = []
+    timestamps_ms = []
+    places = []
+
+    for feature in features:
+        # The USGS payload shape is fixed, so index directly and let the
+        # rare malformed record fall through to the except.
+        try:
+            properties = feature["properties"]
+            depth_km = feature["geometry"]["coordinates"][2]
+            magnitude = properties["mag"]
+            timestamp_ms = properties["time"]
+        except (KeyError, IndexError, TypeError):
+            continue
 
         if timestamp_ms is None:
             continue
 
-        time_utc = datetime.fromtimestamp(
-            timestamp_ms / 1000.0,
-            tz=timezone.utc
+        # Null magnitudes/depths become NaN and are masked out below.
+        event_ids.append(feature.get("id"))
+        magnitudes.append(magnitude)
+        depths.append(depth_km)
+        timestamps_ms.append(timestamp_ms)
+        places.append((properties.get("place") or "Unknown location")[:40])
+
+    mags = np.asarray(magnitudes, dtype=np.float64)
+    depths_km = np.asarray(depths, dtype=np.float64)
+    epoch_ms = np.asarray(timestamps_ms, dtype=np.int64)
+    ids = np.asarray(event_ids, dtype=object)
+    place_names = np.asarray(places, dtype=object)
+
+    valid, energies = compute_energies(mags, depths_km)
+
+    if not valid.all():
+        mags = mags[valid]
+        depths_km = depths_km[valid]
+        epoch_ms = epoch_ms[valid]
+        ids = ids[valid]
+        place_names = place_names[valid]
+        energies = energies[valid]
+
+    times = epoch_ms.astype("datetime64[ms]")
+
+    return QuakeSeries(
+        ids=ids,
+        times=times,
+        days=epoch_ms * _MS_TO_DAYS + _EPOCH_DAYS,
+        mags=mags,
+        depths=depths_km,
+        energies=energies,
+        places=place_names,
+        time_labels=format_hms(times),
+        mag_labels=np.char.mod("%.1f", mags),
+        depth_labels=np.char.mod("%.1f", depths_km),
+    )
+
+
+def empty_series() -> QuakeSeries:
+    """
+    Build an empty QuakeSeries without calling compute_energies, so no JIT
+    compilation runs on the calling (Tk) thread.
+    """
+    return QuakeSeries(
+        ids=np.empty(0, dtype=object),
+        times=np.empty(0, dtype="datetime64[ms]"),
+        days=np.empty(0, dtype=np.float64),
+        mags=np.empty(0, dtype=np.float64),
+        depths=np.empty(0, dtype=np.float64),
+        energies=np.empty(0, dtype=np.float64),
+        places=np.empty(0, dtype=object),
+        time_labels=np.empty(0, dtype="U8"),
+        mag_labels=np.empty(0, dtype="U4"),
+        depth_labels=np.empty(0, dtype="U4"),
+    )
+
+
+def format_hms(times: np.ndarray) -> np.ndarray:
+    """
+    Format datetime64 values as "HH:MM:SS" strings in one vectorized pass.
+    """
+    iso = np.datetime_as_string(times, unit="s").astype("U19")
+    # Each "YYYY-MM-DDTHH:MM:SS" is 19 fixed-width chars; keep chars 11-18.
+    chars = iso.view("U1").reshape(-1, 19)[:, 11:]
+    return np.ascontiguousarray(chars).view("U8").ravel()
+
+
+def merge_series(
+    series: QuakeSeries,
+    drop_ids: List[str],
+    cutoff_ms: int,
+    added: QuakeSeries,
+) -> QuakeSeries:
+    """
+    Drop rows that are replaced or older than cutoff_ms, then append added.
+    """
+    cutoff = np.datetime64(cutoff_ms, "ms")
+    keep = series.times >= cutoff
+    if drop_ids:
+        keep &= ~np.isin(series.ids, drop_ids)
+    keep_added = added.times >= cutoff
+
+    return QuakeSeries(
+        *(
+            np.concatenate([old[keep], new[keep_added]])
+            for old, new in zip(series, added)
         )
+    )
 
-        rows.append(
-            (
-                time_utc,  # keep full datetime for sorting
-                time_utc.strftime("%H:%M:%S"),
-                f"{magnitude:.1f}",
-                f"{depth_km:.1f}",
-                place[:40],
-            )
-        )
 
-        times.append(time_utc)
-        magnitudes.append(magnitude)
+def log_histogram(
+    energies: np.ndarray,
+    nbins: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Bin positive values into nbins buckets that are uniform on a log scale.
+    Returns (edges, counts).
+    """
+    log_e = np.log10(energies)
+    lo, hi = log_e.min(), log_e.max()
 
-        # Relative seismic energy (logarithmic, not absolute joules)
-        energies.append(10 ** (1.5 * magnitude))
+    if hi > lo:
+        idx = ((log_e - lo) * (nbins / (hi - lo))).astype(np.int64)
+        np.clip(idx, 0, nbins - 1, out=idx)
+    else:
+        idx = np.zeros(log_e.size, dtype=np.int64)
+        hi = lo + 1.0
 
-    return rows, times, magnitudes, energies
+    counts = np.bincount(idx, minlength=nbins)
+    edges = 10 ** np.linspace(lo, hi, nbins + 1)
+    return edges, counts
 
 
-def load_history() -> dict:
-    if not HISTORY_FILE.exists():
-        return {}
+def prune_history(history: dict, cutoff_ms: int) -> None:
+    """
+    Remove events older than cutoff_ms from history in place.
+    Events without a timestamp are evicted too; they are never plotted.
+    """
+    expired = []
+    for event_id, feature in history.items():
+        timestamp_ms = _properties(feature).get("time")
+        if timestamp_ms is None or timestamp_ms < cutoff_ms:
+            expired.append(event_id)
+
+    for event_id in expired:
+        del history[event_id]
 
+
+def _ndjson_lines(features: Iterable[dict]) -> bytes:
+    return b"".join(_json_dumps(feature) + b"\n" for feature in features)
+
+
+def _import_legacy_history() -> dict:
+    """
+    One-time import of the pre-NDJSON history file, a single JSON object
+    mapping event ids to features. Writes it out as the new log.
+    """
     try:
-        with HISTORY_FILE.open("r", encoding="utf-8") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, OSError):
+        data = _json_loads(LEGACY_HISTORY_FILE.read_bytes())
+    except (ValueError, OSError):
+        return {}
+
+    if not isinstance(data, dict):
         return {}
 
+    history = {
+        event_id: feature
+        for event_id, feature in data.items()
+        if isinstance(feature, dict)
+    }
+    if history:
+        compact_history(history)
+    return history
+
 
-def save_history(history: dict) -> None:
+def load_history() -> Tuple[dict, int]:
+    """
+    Replay the append-only history log; later lines replace earlier ones.
+    Logs larger than MAX_HISTORY_BYTES are cut down to their newest lines and
+    compacted. Returns (history, number of lines in the file).
+    """
+    try:
+        data = HISTORY_FILE.read_bytes()
+    except FileNotFoundError:
+        history = _import_legacy_history()
+        return history, len(history)
+    except OSError:
+        return {}, 0
+
+    truncated = len(data) > MAX_HISTORY_BYTES
+    if truncated:
+        # Newest events are appended last; drop the partial first line.
+        data = data[-MAX_HISTORY_BYTES:]
+        data = data[data.find(b"\n") + 1:]
+
+    history = {}
+    lines = data.splitlines()
+
+    for line in lines:
+        try:
+            feature = _json_loads(line)
+        except ValueError:
+            continue
+
+        if not isinstance(feature, dict):
+            continue
+
+        event_id = feature.get("id")
+        if event_id:
+            history[event_id] = feature
+
+    records = len(lines)
+    if truncated and compact_history(history):
+        records = len(history)
+
+    return history, records
+
+
+def append_history(features: List[dict]) -> int:
+    """
+    Append one NDJSON line per feature to the history log.
+    Returns the number of records written.
+    """
     try:
-        with HISTORY_FILE.open("w", encoding="utf-8") as f:
-            json.dump(history, f)
+        with HISTORY_FILE.open("a+b") as f:
+            # Terminate a partial line left by an interrupted write so the
+            # first new record is not glued onto it.
+            size = f.seek(0, os.SEEK_END)
+            if size:
+                f.seek(size - 1)
+                if f.read(1) != b"\n":
+                    f.write(b"\n")
+            f.write(_ndjson_lines(features))
     except OSError:
-        pass
+        return 0
+    return len(features)
+
+
+def compact_history(history: dict) -> bool:
+    """
+    Atomically rewrite the history log with one line per live event.
+    """
+    tmp_file = HISTORY_FILE.with_suffix(".tmp")
+    try:
+        tmp_file.write_bytes(_ndjson_lines(history.values()))
+        tmp_file.replace(HISTORY_FILE)
+    except OSError:
+        return False
+    return True
+
+
+def _retention_cutoff_ms() -> int:
+    return int(time.time() * 1000) - HISTORY_RETENTION_MS
+
+
+def _properties(feature: dict) -> dict:
+    return feature.get("properties") or {}
+
+
+def _updated_ms(feature: dict) -> Optional[int]:
+    return _properties(feature).get("updated")
 
 
 # =========================
@@ -136,12 +478,27 @@ def save_history(history: dict) -> None:
 
 class EarthquakeDashboard:
     def __init__(self, root: tk.Tk) -> None:
-        self.history = load_history()
+        # History is loaded by the first refresh, off the Tk thread.
+        self.history: dict = {}
+        self._history_records = 0
+        self._history_loaded = False
+        self._feed_validators: Dict[str, str] = {}
+        self._refresh_lock = threading.Lock()
+        self._last_refresh = float("-inf")
+        self.series = empty_series()
         self.root = root
+        self._start_event_loop()
         self._configure_window()
         self._build_layout()
         self.refresh_async()
 
+    def _start_event_loop(self) -> None:
+        """
+        Run one asyncio loop on a background thread for all refreshes.
+        """
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, daemon=True).start()
+
     def _configure_window(self) -> None:
         self.root.title("Live Earthquake Dashboard")
         self.root.geometry(f"{WINDOW_WIDTH}x{WINDOW_HEIGHT}")
@@ -184,53 +541,128 @@ class EarthquakeDashboard:
         for column in ("time", "mag", "depth", "place"):
             self.tree.heading(column, text=column.capitalize())
 
+        self._init_table_rows()
+
         self.tree.pack(fill=tk.Y)
 
+    def _init_table_rows(self) -> None:
+        """
+        Preallocate the table items; refreshes only rewrite their values.
+        """
+        self._row_ids = [
+            self.tree.insert("", tk.END) for _ in range(MAX_TABLE_ROWS)
+        ]
+        self._rows_shown = 0
+        self.tree.set_children("")
+
     def _build_charts(self, parent: tk.Widget) -> None:
         frame = tk.Frame(parent)
         frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
 
-        self.figure, (self.ax_mag, self.ax_energy) = plt.subplots(
-            2,
-            1,
-            figsize=FIGURE_SIZE,
-        )
+        self.figure = Figure(figsize=FIGURE_SIZE)
+        self.ax_mag, self.ax_energy = self.figure.subplots(2, 1)
 
         self.canvas = FigureCanvasTkAgg(self.figure, master=frame)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
 
-    # =========================
-    # Refresh Logic
-    # =========================
+        self._init_chart_artists()
 
-    def refresh_async(self) -> None:
-        threading.Thread(
-            target=self._refresh_data,
-            daemon=True,
-        ).start()
+    def _init_chart_artists(self) -> None:
+        """
+        Create the persistent artists that every refresh updates in place.
+        """
+        self.ax_mag.set_title("Magnitude vs Time (UTC)")
+        self.ax_mag.set_ylabel("Magnitude")
+        locator = mdates.AutoDateLocator()
+        self.ax_mag.xaxis.set_major_locator(locator)
+        self.ax_mag.xaxis.set_major_formatter(
+            mdates.ConciseDateFormatter(locator)
+        )
 
-    def _refresh_data(self) -> None:
-        try:
-            features = fetch_earthquake_features()
+        # Animated artists are skipped by full draws and blitted on top
+        # of the cached axes background instead.
+        self._scatter = self.ax_mag.scatter([], [], alpha=0.7, animated=True)
 
-            for feature in features:
-                event_id = feature.get("id")
-                if event_id:
-                    self.history[event_id] = feature
+        edges = 10 ** np.linspace(0, 1, ENERGY_BINS + 1)
+        self._bars = self.ax_energy.bar(
+            edges[:-1],
+            np.zeros(ENERGY_BINS),
+            width=np.diff(edges),
+            align="edge",
+        )
+        self._energy_key = None
+        self.ax_energy.set_xscale("log")
+        self.ax_energy.set_title("Energy Distribution (No Data)")
+        self.ax_energy.set_xlabel("Energy Index")
+        self.ax_energy.set_ylabel("Count")
 
-            save_history(self.history)
+        self._background = None
+        self.canvas.mpl_connect("draw_event", self._on_draw)
 
-            all_features = list(self.history.values())
+        # Axis sizes are stable between refreshes, so the layout is only
+        # recomputed once real data arrives or a title changes.
+        self.figure.tight_layout()
+        self._layout_dirty = True
+        self.canvas.draw()
 
-            rows, times, mags, energies = parse_earthquakes(all_features)
+    def _on_draw(self, event) -> None:
+        self._background = self.canvas.copy_from_bbox(self.ax_mag.bbox)
+        self.ax_mag.draw_artist(self._scatter)
+
+    # =========================
+    # Refresh Logic
+    # =========================
 
+    def refresh_async(self) -> None:
+        # Coalesce rapid clicks: at most one refresh in flight, and none
+        # within MIN_REFRESH_INTERVAL_SECONDS of the previous start.
+        now = time.monotonic()
+        if now - self._last_refresh < MIN_REFRESH_INTERVAL_SECONDS:
+            return
+        if not self._refresh_lock.acquire(blocking=False):
+            return
+
+        self._last_refresh = now
+        asyncio.run_coroutine_threadsafe(self._refresh_locked(), self._loop)
+
+    async def _refresh_locked(self) -> None:
+        try:
+            await self._refresh_coro()
+        except Exception:
+            # Surface unexpected failures like an uncaught thread exception
+            # would, instead of letting the discarded future swallow them.
+            traceback.print_exc()
             self.root.after(
                 0,
-                self._update_ui,
-                rows,
-                times,
-                mags,
-                energies,
+                lambda: self.status_label.config(
+                    text="Failed to refresh data"
+                ),
+            )
+        finally:
+            self._refresh_lock.release()
+
+    def _load_history(self) -> None:
+        history, self._history_records = load_history()
+        prune_history(history, _retention_cutoff_ms())
+        self.history = history
+        self._maybe_compact_history()
+        self.series = parse_earthquakes(list(history.values()))
+        self._history_loaded = True
+
+        if self.series.ids.size:
+            self.root.after(0, self._update_ui, self.series)
+
+    async def _refresh_coro(self) -> None:
+        if not self._history_loaded:
+            self._load_history()
+
+        # The blocking fetch runs on the loop's default executor, which
+        # reuses its worker threads across refreshes.
+        try:
+            features, validators = await self._loop.run_in_executor(
+                None,
+                fetch_earthquake_features,
+                self._feed_validators,
             )
         except RuntimeError:
             self.root.after(
@@ -239,54 +671,161 @@ class EarthquakeDashboard:
                     text="Failed to fetch data"
                 ),
             )
+            return
 
-    def _update_ui(
-        self,
-        rows: List[tuple],
-        times: List[datetime],
-        mags: List[float],
-        energies: List[float],
-    ) -> None:
-        self.tree.delete(*self.tree.get_children())
+        if features is None:
+            checked = datetime.now(timezone.utc).strftime("%H:%M:%S")
+            self.root.after(
+                0,
+                lambda: self.status_label.config(
+                    text=f"Last checked: {checked} UTC (no changes)"
+                ),
+            )
+            return
+
+        self._refresh_data(features)
+
+        # Only remember the response once it has been applied; otherwise a
+        # failed refresh would be reported as "no changes" next time.
+        self._feed_validators = validators
+
+    def _refresh_data(self, features: List[dict]) -> None:
+        cutoff_ms = _retention_cutoff_ms()
+        history = self.history
+        changed = {}
+
+        for feature in features:
+            event_id = feature.get("id")
+            if not event_id:
+                continue
+
+            stored = history.get(event_id)
+            if stored is None or _updated_ms(stored) != _updated_ms(feature):
+                changed[event_id] = feature
+
+        # Only new or revised events are parsed; the rest of the series is
+        # carried over from the previous refresh.
+        changed_ids = list(changed)
+        if changed:
+            # Copy-on-write: build the next history aside and publish it
+            # with a single reference swap, so readers of self.history never
+            # see a dict mid-mutation.
+            new_history = dict(history)
+            new_history.update(changed)
+            prune_history(new_history, cutoff_ms)
+            self.history = new_history
+
+            self._history_records += append_history(
+                [f for f in changed.values() if f["id"] in new_history]
+            )
+            self._maybe_compact_history()
 
-        rows.sort(key=lambda r: r[0], reverse=True)
+        series = merge_series(
+            self.series,
+            changed_ids,
+            cutoff_ms,
+            parse_earthquakes(list(changed.values())),
+        )
+        self.series = series
+
+        self.root.after(0, self._update_ui, series)
+
+    def _maybe_compact_history(self) -> None:
+        # Revised and evicted events leave stale lines behind; rewrite the
+        # log once it holds more than twice the live record count.
+        if self._history_records > 2 * len(self.history):
+            if compact_history(self.history):
+                self._history_records = len(self.history)
+
+    def _update_ui(self, series: QuakeSeries) -> None:
+        # Newest first; argsort on the int64 timestamps avoids per-row
+        # Python comparisons.
+        order = np.argsort(series.times)[::-1]
+        recent = order[:PLOT_MAX_POINTS]
+        order = order[:MAX_TABLE_ROWS]
+
+        rows = zip(
+            series.time_labels[order].tolist(),
+            series.mag_labels[order].tolist(),
+            series.depth_labels[order].tolist(),
+            series.places[order].tolist(),
+        )
 
-        for row in rows[:MAX_TABLE_ROWS]:
-            _, time_str, mag, depth, place = row
-            self.tree.insert("", tk.END, values=(time_str, mag, depth, place))
+        for row_id, values in zip(self._row_ids, rows):
+            self.tree.item(row_id, values=values)
 
-        self.ax_mag.clear()
-        self.ax_mag.scatter(times, mags, alpha=0.7)
-        self.ax_mag.set_title("Magnitude vs Time (UTC)")
-        self.ax_mag.set_ylabel("Magnitude")
+        shown = order.size
+        if shown != self._rows_shown:
+            self.tree.set_children("", *self._row_ids[:shown])
+            self._rows_shown = shown
 
-        self.ax_energy.clear()
-
-        if energies:
-            emin = min(energies)
-            emax = max(energies)
-
-            if emin > 0:
-                log_bins = np.logspace(
-                    math.log10(emin),
-                    math.log10(emax),
-                    30
-                )
-                self.ax_energy.hist(energies, bins=log_bins)
-                self.ax_energy.set_xscale("log")
-                self.ax_energy.set_title("Energy Distribution (Log Scale)")
-                self.ax_energy.set_xlabel("Energy Index")
-                self.ax_energy.set_ylabel("Count")
-            else:
-                self.ax_energy.set_title("Energy Distribution (No Data)")
+        redraw = self._update_scatter(series, recent)
+        redraw |= self._update_energy_bars(series.energies)
 
-        self.figure.tight_layout()
-        self.canvas.draw()
+        if redraw or self._background is None:
+            if self._layout_dirty:
+                self.figure.tight_layout()
+                self._layout_dirty = False
+            self.canvas.draw_idle()
+        else:
+            self.canvas.restore_region(self._background)
+            self.ax_mag.draw_artist(self._scatter)
+            self.canvas.blit(self.ax_mag.bbox)
 
         self.status_label.config(
             text=f"Last updated: {datetime.now(timezone.utc).strftime('%H:%M:%S')} UTC"
         )
 
+    def _update_scatter(self, series: QuakeSeries, recent: np.ndarray) -> bool:
+        """
+        Move the scatter points to the events at indices recent and rescale
+        the magnitude axis.
+        Returns True when the axis limits changed and need a full redraw.
+        """
+        offsets = np.column_stack([series.days[recent], series.mags[recent]])
+        self._scatter.set_offsets(offsets)
+
+        limits = (self.ax_mag.get_xlim(), self.ax_mag.get_ylim())
+
+        if offsets.size:
+            self.ax_mag.ignore_existing_data_limits = True
+            self.ax_mag.update_datalim(offsets)
+            self.ax_mag.autoscale_view()
+
+        return (self.ax_mag.get_xlim(), self.ax_mag.get_ylim()) != limits
+
+    def _update_energy_bars(self, energies: np.ndarray) -> bool:
+        """
+        Resize the persistent histogram bars in place.
+        Returns True when the histogram changed and needs a full redraw.
+        """
+        if energies.size and energies.min() > 0:
+            edges, counts = log_histogram(energies, ENERGY_BINS)
+            title = "Energy Distribution (Log Scale)"
+        else:
+            edges = 10 ** np.linspace(0, 1, ENERGY_BINS + 1)
+            counts = np.zeros(ENERGY_BINS, dtype=np.int64)
+            title = "Energy Distribution (No Data)"
+
+        key = (edges.tobytes(), counts.tobytes())
+        if key == self._energy_key:
+            return False
+        self._energy_key = key
+
+        for bar, left, width, height in zip(
+            self._bars, edges[:-1], np.diff(edges), counts
+        ):
+            bar.set_x(left)
+            bar.set_width(width)
+            bar.set_height(height)
+
+        self.ax_energy.set_xlim(edges[0], edges[-1])
+        self.ax_energy.set_ylim(0, max(counts.max(), 1) * 1.05)
+        if self.ax_energy.get_title() != title:
+            self.ax_energy.set_title(title)
+            self._layout_dirty = True
+        return True
+
 
 # =========================
 # Entry Point